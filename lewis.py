@@ -15,6 +15,16 @@
 #
 # =============================================================================
 
+# --- Chemical Data ---
+# Every supported element has a small integer ID, and the per-element data
+# lives in tuples indexed by that ID. On the calculator's MicroPython,
+# indexing a tuple is much cheaper than hashing a symbol string into a
+# dict, so the hot loops only ever see element IDs; symbol strings are
+# resolved to IDs once at parse time.
+ELEMENT_ID = {'H':0,'B':1,'C':2,'N':3,'O':4,'F':5,'Be':6,'Li':7,'Na':8,'Mg':9,'Al':10,'Si':11,'P':12,'S':13,'Cl':14,'K':15,'Ca':16,'Ga':17,'Ge':18,'As':19,'Se':20,'Br':21,'I':22,'Xe':23,'Kr':24}
+VE_TUP = (1,3,4,5,6,7,2,1,1,2,3,4,5,6,7,1,2,3,4,5,6,7,7,8,8)
+EN_TUP = (2.2,2.04,2.55,3.04,3.44,3.98,1.57,0.98,0.93,1.31,1.61,1.9,2.19,2.58,3.16,0.82,1.0,1.81,2.01,2.18,2.55,2.96,2.66,2.6,3.0)
+
 # --- VSEPR Data Table ---
 # A dictionary that maps the number of bonded atoms (X) and lone pairs (E)
 # on a central atom to its VSEPR geometry.
@@ -36,16 +46,17 @@ VSEPR = {
     (6,0): ("AX6","Octahedral","90","sp3d2"),
 }
 
-def show_vsepr_info(structure, central_atom):
+def show_vsepr_info(structure, central_symbol):
     """
     Calculates and prints the VSEPR geometry prediction based on the
     number of bonded atoms and lone pairs from the final Lewis structure.
     """
-    X = len(structure['bonds'])
-    E = structure['lone_pairs'].get(central_atom, 0) // 2
-    
+    # Index 0 of the SoA lists is the central atom; 1..N are terminals.
+    X = len(structure['bonds']) - 1
+    E = structure['lone_pairs'][0] // 2
+
     print("\n--VSEPR Prediction--")
-    print("Central atom: " + str(central_atom[:-1]))
+    print("Central atom: " + str(central_symbol))
     print("Bonded atoms (X): " + str(X))
     print("Lone pairs (E): " + str(E))
     
@@ -59,34 +70,157 @@ def show_vsepr_info(structure, central_atom):
     else:
         print("No VSEPR entry for X=" + str(X) + ", E=" + str(E))
 
-def combinations(iterable, r):
+def _explore(sym_ids, en_arr, bonds, lone_pairs, fc, central_bond_sum, halogen_terminals, is_period_2):
     """
-    A custom implementation of the 'combinations' function from Python's
-    itertools library, which is not available in this MicroPython environment.
+    The search kernel: explores all plausible bonding patterns by promoting
+    lone pairs from terminal atoms to form multiple bonds, with intelligent
+    pruning to prevent freezes on the calculator.
+
+    Every stored structure shares the single-bonded skeleton and differs
+    only by which terminal bonds were promoted, so instead of snapshotting
+    whole lists the kernel returns one small record per unique plausible
+    structure: (promotions, primary_score, penalty_score), where
+    promotions is a tuple of (terminal index, bond order) pairs for
+    terminals with order > 1. The full lists are rebuilt on demand by
+    LewisStructureCreator._expand_structure for the few structures that
+    are actually displayed; on the calculator's ~32 kB heap this is what
+    keeps many-resonance molecules from running out of memory.
+
+    The depth-first walk uses an explicit stack instead of recursion:
+    MicroPython allocates a frame per call, and deep molecules like SF6
+    or PF6- can exhaust the calculator's small call stack.
+
+    This is a free function over plain integer lists and scalars on
+    purpose: there is no attribute access left in the hot loop, and a
+    desktop build can hand exactly this function to a JIT compiler (e.g.
+    numba.njit) without touching the rest of the program.
     """
-    pool = tuple(iterable)
-    n = len(pool)
-    if r > n: return
-    indices = list(range(r))
-    yield tuple(pool[i] for i in indices)
-    while True:
-        # Loop backwards through the indices to find the next combination
-        for i in range(r - 1, -1, -1):
-            if indices[i] != i + n - r: break
-        else: return
-        indices[i] += 1
-        for j in range(i + 1, r):
-            indices[j] = indices[j - 1] + 1
-        yield tuple(pool[i] for i in indices)
+    n = len(sym_ids)
+    seen = set()
+    stored_keys = set()
+    results = []
+
+    # Stack entries are (promo, next_i):
+    #   promo > 0  -- promote a lone pair of terminal `promo` into a
+    #                 bond, then expand from terminal `next_i` upward;
+    #   promo == 0 -- the root state (no promotion);
+    #   promo < 0  -- undo the earlier promotion of terminal `-promo`
+    #                 once its whole subtree has been explored.
+    # Expanding only terminals >= next_i generates each set of
+    # promotions once, in index order, rather than once per ordering.
+    stack = [(0, 1)]
+    while stack:
+        promo, next_i = stack.pop()
+
+        if promo < 0:
+            i = -promo
+            bonds[i] -= 1
+            lone_pairs[i] += 2
+            fc[i] -= 1
+            fc[0] += 1
+            central_bond_sum -= 1
+            continue
+
+        if promo > 0:
+            # Mutate the shared lists in place; the undo entry pushed
+            # here reverts them after the subtree. Promoting a lone
+            # pair into a bond raises the terminal's formal charge by 1
+            # and lowers the central atom's by 1.
+            i = promo
+            bonds[i] += 1
+            lone_pairs[i] -= 2
+            fc[i] += 1
+            fc[0] -= 1
+            central_bond_sum += 1
+            stack.append((-i, 0))
+
+        # Checks are ordered by cost so cheap tests can skip expensive
+        # ones entirely on doomed branches.
+
+        # Pruning Rule 1: Stop if a terminal halogen has a positive charge.
+        # This is a chemically impossible situation and prevents freezes on
+        # molecules like SCl4. It only touches the halogen indices, so it
+        # runs before the memo key (a sort plus tuple build) is paid for.
+        bad_halogen = False
+        for i in halogen_terminals:
+            if fc[i] > 0:
+                bad_halogen = True
+                break
+        if bad_halogen:
+            continue
+
+        # --- Memoization ---
+        # Two states that only permute equivalent terminals (e.g.
+        # promoting O1 vs O2 in SO4-2) are the same structure;
+        # canonicalize by sorting the per-terminal (element ID, bond
+        # order, lone pairs) triples and explore each canonical state
+        # exactly once.
+        key = tuple(sorted(zip(sym_ids[1:], bonds[1:], lone_pairs[1:])))
+        if key in seen:
+            continue
+        seen.add(key)
+
+        # The structure is plausible: store it if it's unique. The bond
+        # orders fully determine the structure (lone pairs and charges
+        # follow from the promotions), so the promotion tuple doubles as
+        # the uniqueness key. Both scores are computed here, while the
+        # live lists are still at this state; they are accumulated
+        # manually to avoid a throwaway list per structure.
+        promos = []
+        for i in range(1, n):
+            if bonds[i] > 1: promos.append((i, bonds[i]))
+        promos = tuple(promos)
+        if promos not in stored_keys:
+            stored_keys.add(promos)
+            # Primary score: the sum of absolute formal charges.
+            primary = 0
+            for c in fc:
+                primary += c if c >= 0 else -c
+            # Penalty score (tie-breaker): penalize positive charges on
+            # electronegative atoms and negative charges on less
+            # electronegative ones.
+            penalty = 0
+            for i in range(n):
+                c = fc[i]
+                if c > 0:
+                    penalty += c * en_arr[i]
+                elif c < 0:
+                    penalty += -c * (4.0 - en_arr[i])
+            results.append((promos, primary, penalty))
+
+        central_electrons = central_bond_sum * 2 + lone_pairs[0]
+
+        # If the central atom is from Period 2, it cannot exceed an octet.
+        # This is O(1), so it runs before the terminal scan below.
+        if is_period_2 and central_electrons >= 8:
+            continue
+
+        # --- Intelligent "Stop" Rule ---
+        # Check if all terminals are neutral.
+        all_terminals_neutral = True
+        for i in range(1, n):
+            if fc[i] != 0:
+                all_terminals_neutral = False
+                break
+
+        # If the central atom has a stable octet and good formal charges, there's no
+        # reason to expand the octet. Pruning this branch stops freezes on PF6-, etc.
+        if central_electrons == 8 and fc[0] <= 0 and all_terminals_neutral:
+            continue
+
+        # For each terminal atom that can donate a lone pair, push a
+        # child state. Pushed in reverse so they pop in index order,
+        # matching the old recursive traversal.
+        for i in range(n - 1, next_i - 1, -1):
+            if lone_pairs[i] >= 2 and bonds[i] < 3:
+                stack.append((i, i))
+
+    return results
 
 # =============================================================================
 # Main Lewis Structure Class
 # =============================================================================
 class LewisStructureCreator:
-    # --- Chemical Data ---
-    VALENCE_ELECTRONS = {'H':1,'B':3,'C':4,'N':5,'O':6,'F':7,'Be':2,'Li':1,'Na':1,'Mg':2,'Al':3,'Si':4,'P':5,'S':6,'Cl':7,'K':1,'Ca':2,'Ga':3,'Ge':4,'As':5,'Se':6,'Br':7,'I':7,'Xe':8,'Kr':8}
-    ELECTRONEGATIVITY = {'H':2.2,'B':2.04,'C':2.55,'N':3.04,'O':3.44,'F':3.98,'Be':1.57,'Li':0.98,'Na':0.93,'Mg':1.31,'Al':1.61,'Si':1.9,'P':2.19,'S':2.58,'Cl':3.16,'K':0.82,'Ca':1.0,'Ga':1.81,'Ge':2.01,'As':2.18,'Se':2.55,'Br':2.96,'I':2.66,'Xe':2.6,'Kr':3.0}
-
     def __init__(self, formula_string):
         """
         Initializes the creator, parses the formula, and sets up
@@ -133,7 +267,7 @@ class LewisStructureCreator:
             # Handle two-letter element symbols (e.g., "Cl", "Mg").
             if i < len(temp) and temp[i].islower(): s += temp[i]; i += 1
             
-            if s not in self.VALENCE_ELECTRONS:
+            if s not in ELEMENT_ID:
                 print("Error: Element '" + str(s) + "' not supported.")
                 return None, None
             
@@ -152,7 +286,7 @@ class LewisStructureCreator:
     def _calculate_total_valence_electrons(self):
         """Calculates the total number of valence electrons for the molecule."""
         total = 0
-        for s, c in self.atom_counts.items(): total += self.VALENCE_ELECTRONS[s] * c
+        for s, c in self.atom_counts.items(): total += VE_TUP[ELEMENT_ID[s]] * c
         return total - self.charge
 
     def _find_central_atom(self):
@@ -165,14 +299,25 @@ class LewisStructureCreator:
         """
         keys = list(self.atom_counts.keys())
         if len(keys) == 1: return keys[0]
-        
+
         candidates = {s: c for s, c in self.atom_counts.items() if s != 'H'}
-        if not candidates: return min(keys, key=lambda s: self.ELECTRONEGATIVITY[s])
-        
-        singles = [s for s, c in candidates.items() if c == 1]
-        if len(singles) == 1: return singles[0]
-        
-        return min(list(candidates.keys()), key=lambda s: self.ELECTRONEGATIVITY[s])
+        if candidates:
+            singles = [s for s, c in candidates.items() if c == 1]
+            if len(singles) == 1: return singles[0]
+            pool = candidates.keys()
+        else:
+            pool = keys
+
+        # A plain loop instead of min(..., key=lambda ...): on MicroPython
+        # the lambda allocates a closure and is called once per element.
+        best_s = None
+        best_en = 999
+        for s in pool:
+            en = EN_TUP[ELEMENT_ID[s]]
+            if en < best_en:
+                best_en = en
+                best_s = s
+        return best_s
 
     def _generate_structures(self):
         """
@@ -197,109 +342,93 @@ class LewisStructureCreator:
         for s in terms:
             # Terminal atoms are 'Symbol1', 'Symbol2', etc. This prevents a
             # name collision with the central atom.
-            idx = temp_counts.get(s, 1) 
+            idx = temp_counts.get(s, 1)
             self.terminal_atoms.append(s + str(idx))
             temp_counts[s] = idx + 1
-        
+
+        # SoA layout: atom index 0 is the central atom, 1..N are the
+        # terminals. All hot loops work on these parallel lists with plain
+        # integer indices; the string labels above are only used when a
+        # structure is finally formatted for display.
+        self.symbols = [c_symbol] + terms
+        self.sym_ids = [ELEMENT_ID[s] for s in self.symbols]
+        self.valence_arr = [VE_TUP[e] for e in self.sym_ids]
+        self.en_arr = [EN_TUP[e] for e in self.sym_ids]
+        # Octet-fill demand per atom: H needs 0 extra electrons, every
+        # other element needs 6 to complete its octet next to one bond.
+        h_id = ELEMENT_ID['H']
+        self.need_arr = [0 if e == h_id else 6 for e in self.sym_ids]
+        n = len(self.symbols)
+
+        # Terminal halogens are checked on every recursion node (Pruning
+        # Rule 1), so find their indices once here.
+        halogens = frozenset(('F', 'Cl', 'Br', 'I'))
+        self.halogen_terminals = []
+        for i in range(1, n):
+            if self.symbols[i] in halogens: self.halogen_terminals.append(i)
+
         # Build the single-bonded skeleton.
-        nb = len(self.terminal_atoms)
+        nb = n - 1
         e_in_b = nb * 2
         if e_in_b > self.total_valence_electrons: return # Not enough electrons
-        
-        bonds = {a: 1 for a in self.terminal_atoms}
+
+        # bonds[i] is the order of the bond between the central atom and
+        # terminal i; bonds[0] is unused and stays 0.
+        bonds = [0] + [1] * nb
         lp_electrons = self.total_valence_electrons - e_in_b
-        
+
         # Distribute lone pairs, filling terminal atoms first.
-        lone_pairs = {a: 0 for a in [self.central_atom] + self.terminal_atoms}
-        for t in self.terminal_atoms:
-            sym = t[:-1] if t[-1].isdigit() else t
-            need = 0 if sym == 'H' else 6 # H needs 0, others need 6 to complete octet.
-            take = min(lp_electrons, need)
-            lone_pairs[t] += take; lp_electrons -= take
-        
+        lone_pairs = [0] * n
+        need_arr = self.need_arr
+        for i in range(1, n):
+            take = min(lp_electrons, need_arr[i])
+            lone_pairs[i] += take; lp_electrons -= take
+
         # Any remaining electrons go to the central atom.
-        lone_pairs[self.central_atom] += lp_electrons
+        lone_pairs[0] += lp_electrons
         
-        # Start the recursive process to find all plausible structures.
-        self._satisfy_central_octet(bonds, lone_pairs)
+        # Each promotion step changes exactly one terminal and the central
+        # atom, so the formal charges and the central atom's bond count are
+        # computed once here and then maintained by +/-1 deltas in the
+        # search instead of being rebuilt at every node. The skeleton has
+        # exactly one single bond per terminal, so the initial sum is nb.
+        central_bond_sum = nb
+        fc = [0] * n
+        for i in range(1, n):
+            fc[i] = self.valence_arr[i] - lone_pairs[i] - bonds[i]
+        fc[0] = self.valence_arr[0] - lone_pairs[0] - central_bond_sum
 
-    def _satisfy_central_octet(self, bonds, lone_pairs):
-        """
-        A recursive function that explores all plausible bonding patterns by
-        promoting lone pairs from terminal atoms to form multiple bonds.
-        It includes intelligent pruning to prevent freezes on the calculator.
-        """
-        # --- Pre-calculation and Pruning ---
-        fc = {}
-        all_atoms = [self.central_atom] + self.terminal_atoms
-        for atom in all_atoms:
-            sym = atom[:-1] if atom[-1].isdigit() else atom
-            val = self.VALENCE_ELECTRONS[sym]
-            nb = bonds.get(atom, 0) if atom != self.central_atom else sum(bonds.values())
-            lp = lone_pairs.get(atom, 0)
-            fc[atom] = val - lp - nb
-
-        # Pruning Rule 1: Stop if a terminal halogen has a positive charge.
-        # This is a chemically impossible situation and prevents freezes on molecules like SCl4.
-        for atom in self.terminal_atoms:
-            if (atom[:-1] if atom[-1].isdigit() else atom) in ['F', 'Cl', 'Br', 'I']:
-                if fc.get(atom, 0) > 0:
-                    return
+        # Keep the base (single-bonded skeleton) state around so stored
+        # promotion diffs can be expanded back into full lists on demand.
+        self._base_lone_pairs = lone_pairs[:]
+        self._base_fc = fc[:]
 
-        # If the structure is plausible, store it.
-        self._store_if_valid(bonds, lone_pairs)
+        # Run the search kernel, then wrap its per-structure records into
+        # dicts for scoring and display.
+        is_period_2 = self.symbols[0] in ['B', 'C', 'N', 'O', 'F']
+        for rec in _explore(self.sym_ids, self.en_arr, bonds, lone_pairs, fc,
+                            central_bond_sum, self.halogen_terminals,
+                            is_period_2):
+            self.all_valid_structures.append({'promo': rec[0], 'primary_score': rec[1],
+                                              'penalty_score': rec[2]})
 
-        # --- Intelligent "Stop" Rule ---
-        central_symbol = self.central_atom[:-1]
-        bonds_electrons = sum(bonds.values()) * 2
-        central_electrons = bonds_electrons + lone_pairs.get(self.central_atom, 0)
-        
-        # Check if all terminals are neutral.
-        all_terminals_neutral = True
-        for atom in self.terminal_atoms:
-            if fc.get(atom, 0) != 0:
-                all_terminals_neutral = False
-                break
-        
-        # If the central atom has a stable octet and good formal charges, there's no
-        # reason to expand the octet. Pruning this branch stops freezes on PF6-, etc.
-        if central_electrons == 8 and fc.get(self.central_atom, 0) <= 0 and all_terminals_neutral:
-            return
-
-        # --- Recursive Step ---
-        # If the central atom is from Period 2, it cannot exceed an octet.
-        is_period_2 = central_symbol in ['B', 'C', 'N', 'O', 'F']
-        if is_period_2 and central_electrons >= 8:
-            return
-
-        # For each terminal atom that can donate a lone pair, create a new
-        # structure with a multiple bond and analyze it recursively.
-        for terminal_atom in self.terminal_atoms:
-            if lone_pairs.get(terminal_atom, 0) >= 2 and bonds.get(terminal_atom, 1) < 3:
-                new_bonds = bonds.copy()
-                new_lone_pairs = lone_pairs.copy()
-                new_bonds[terminal_atom] += 1
-                new_lone_pairs[terminal_atom] -= 2
-                
-                self._satisfy_central_octet(new_bonds, new_lone_pairs)
-
-    def _store_if_valid(self, bonds, lone_pairs):
-        """Calculates formal charges and stores the complete structure if it's unique."""
-        structure = {'bonds': bonds, 'lone_pairs': lone_pairs}
-        fc = {}
-        all_atoms = [self.central_atom] + self.terminal_atoms
-        for atom in all_atoms:
-            sym = atom[:-1] if atom[-1].isdigit() else atom
-            val = self.VALENCE_ELECTRONS[sym]
-            nb = bonds.get(atom, 0) if atom != self.central_atom else sum(bonds.values())
-            lp = lone_pairs.get(atom, 0)
-            charge = val - lp - nb
-            fc[atom] = charge
-        structure['formal_charges'] = fc
-        
-        # Add the structure only if it's not already in the list.
-        if structure not in self.all_valid_structures:
-            self.all_valid_structures.append(structure)
+    def _expand_structure(self, s):
+        """
+        Rebuilds the full bond/lone-pair/formal-charge lists from a stored
+        promotion diff (see _explore). Only called for the handful of
+        structures that are actually displayed.
+        """
+        n = len(self.sym_ids)
+        bonds = [0] + [1] * (n - 1)
+        lone_pairs = self._base_lone_pairs[:]
+        fc = self._base_fc[:]
+        for i, order in s['promo']:
+            extra = order - 1
+            bonds[i] = order
+            lone_pairs[i] -= 2 * extra
+            fc[i] += extra
+            fc[0] -= extra
+        return {'bonds': bonds, 'lone_pairs': lone_pairs, 'formal_charges': fc}
 
     def get_optimal_structures(self):
         """
@@ -314,65 +443,64 @@ class LewisStructureCreator:
         optimal_structures = []
 
         for s in self.all_valid_structures:
-            # 1. Primary Score: The sum of absolute formal charges (lower is better).
-            primary_score = sum([abs(c) for c in s['formal_charges'].values()])
-
-            # 2. Penalty Score (Tie-breaker): Penalize poor charge placement.
-            penalty_score = 0
-            for atom, charge in s['formal_charges'].items():
-                symbol = atom[:-1] if atom[-1].isdigit() else atom
-                en = self.ELECTRONEGATIVITY[symbol]
-                
-                # Penalize positive charges on electronegative atoms.
-                if charge > 0:
-                    penalty_score += charge * en 
-                # Penalize negative charges on less electronegative atoms.
-                elif charge < 0:
-                    penalty_score += abs(charge) * (4.0 - en)
-            
-            current_score = (primary_score, penalty_score)
+            # Both scores were computed by the search kernel when the
+            # structure was stored:
+            # 1. Primary Score: The sum of absolute formal charges (lower
+            #    is better).
+            # 2. Penalty Score (Tie-breaker): Penalizes poor charge
+            #    placement.
+            current_score = (s['primary_score'], s['penalty_score'])
 
-            # Compare to the best score found so far.
-            if current_score[0] < best_score[0]:
+            # Compare to the best score found so far. Tuples compare
+            # lexicographically, so one comparison covers both the primary
+            # score and the tie-breaker.
+            if current_score < best_score:
                 best_score = current_score
                 optimal_structures = [s] # Found a new best, start the list over.
-            elif current_score[0] == best_score[0]:
-                if current_score[1] < best_score[1]:
-                    best_score = current_score
-                    optimal_structures = [s] # Same primary score, but better tie-breaker.
-                elif current_score[1] == best_score[1]:
-                    optimal_structures.append(s) # Identical scores, this is a resonance form.
+            elif current_score == best_score:
+                optimal_structures.append(s) # Identical scores, this is a resonance form.
 
         if not optimal_structures:
             return None, []
 
-        return optimal_structures[0], optimal_structures[1:]
+        # Expand only the structures that will be displayed; everything
+        # else stays as a small promotion diff.
+        expanded = [self._expand_structure(s) for s in optimal_structures]
+        return expanded[0], expanded[1:]
 
     def format_structure(self, s, title):
-        """Formats a single structure's data into a readable string."""
+        """Formats a single structure's data into a readable string.
+
+        This is the only place the integer-indexed SoA lists are converted
+        back into the 'Symbol0'/'Symbol1' display labels.
+        """
+        labels = [self.central_atom] + self.terminal_atoms
         out = ["--- " + str(title) + " ---", "\n[Structure]"]
         bond_symbols = {1:'-', 2:'=', 3:'~'} # Using ~ for triple bond
-        for atom, order in s['bonds'].items():
-            out.append("  " + self.central_atom + " " + bond_symbols.get(order, '?') + " " + atom)
-        
+        bonds = s['bonds']
+        for i in range(1, len(bonds)):
+            out.append("  " + self.central_atom + " " + bond_symbols.get(bonds[i], '?') + " " + labels[i])
+
         out.append("\n[Lone Pairs]")
-        # Sorting keys before printing is necessary for consistent output.
-        keys_lp = sorted(list(s['lone_pairs'].keys()))
-        for k in keys_lp:
-            lp = s['lone_pairs'][k]
-            if lp > 0: out.append("  " + k + ": " + str(lp) + "e (" + str(lp//2) + " pairs)")
-        
+        # Atom index order is already canonical (central atom first, then
+        # the terminals in their fixed numbering), so iterate directly
+        # instead of re-sorting labels per print.
+        lp_list = s['lone_pairs']
+        for i in range(len(lp_list)):
+            lp = lp_list[i]
+            if lp > 0: out.append("  " + labels[i] + ": " + str(lp) + "e (" + str(lp//2) + " pairs)")
+
         out.append("\n[Formal Charges]")
         anyc = False
-        keys_fc = sorted(list(s['formal_charges'].keys()))
-        for k in keys_fc:
-            ch = s['formal_charges'][k]
+        fc_list = s['formal_charges']
+        for i in range(len(fc_list)):
+            ch = fc_list[i]
             if ch != 0:
                 anyc = True
                 sign = "+" if ch > 0 else ""
-                out.append("  " + k + ": " + sign + str(ch))
+                out.append("  " + labels[i] + ": " + sign + str(ch))
         if not anyc: out.append("  All charges are zero.")
-        
+
         return "\n".join(out)
 
 # =============================================================================
@@ -392,7 +520,7 @@ def main():
             print("\n" + "="*21)
             print(creator.format_structure(opt, "Most Optimal Structure"))
             print("="*21)
-            show_vsepr_info(opt, creator.central_atom)
+            show_vsepr_info(opt, creator.symbols[0])
 
             if resonances:
                 print("\nThis molecule exhibits resonance.")